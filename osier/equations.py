@@ -121,18 +121,17 @@ def objective_from_energy(technology_list, attribute, solved_dispatch_model):
     dispatch_results = solved_dispatch_model.results
     power_units = solved_dispatch_model.power_units
     time_delta = solved_dispatch_model.time_delta
-    dispatch_values = dispatch_results[column_names].values.T*power_units*time_delta
-    
+    dispatch_totals = dispatch_results[column_names].values.sum(axis=0) \
+        * power_units * time_delta
+
     mass_u = valid_techs[0].unit_mass
     attributes = unyt_array([getattr(t, attribute)
                            for t in valid_techs])
     
     attributes = attributes.to(mass_u*(power_units*time_delta.units)**-1)*time_delta.to_value()
 
-    objective_value = np.dot(
-        attributes,
-        dispatch_values).sum()
-    
+    objective_value = np.dot(attributes, dispatch_totals)
+
 
     return objective_value.to_value()
 
@@ -8,6 +8,7 @@ import functools
 import time
 
 from osier import DispatchModel
+from osier.utils import partition_techs
 
 from pymoo.core.problem import ElementwiseProblem
 
@@ -100,6 +101,8 @@ class CapacityExpansion(ElementwiseProblem):
                  solver='cbc',
                  **kwargs):
         self.technology_list = deepcopy(technology_list)
+        _, self._dispatchable_techs, _, _ = partition_techs(
+            self.technology_list)
         self.demand = demand
         self.prm = prm
 
@@ -159,7 +162,7 @@ class CapacityExpansion(ElementwiseProblem):
 
     @property
     def dispatchable_techs(self):
-        return [t for t in self.technology_list if t.dispatchable]
+        return self._dispatchable_techs
 
     def _evaluate(self, x, out, *args, **kwargs):
         capacities = self.capacity_requirement * x
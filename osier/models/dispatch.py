@@ -456,12 +456,13 @@ class DispatchModel():
     def _supply_constraints(self):
         self.model.oversupply = pe.ConstraintList()
         self.model.undersupply = pe.ConstraintList()
+        has_storage = len(self.storage_techs) > 0
         for t in self.model.Time:
             generation = sum(self.model.x[g, t] for g in self.model.Generators
                              if g != 'Curtailment')
             if self.curtailment:
                 generation -= self.model.x['Curtailment', t]
-            if len(self.storage_techs) > 0:
+            if has_storage:
                 generation -= sum(self.model.charge[s, t]
                                   for s in self.model.StorageTech)
             over_demand = self.model.Demand[t] * (1 + self.oversupply)
@@ -471,9 +472,10 @@ class DispatchModel():
 
     def _generation_constraint(self):
         self.model.gen_limit = pe.ConstraintList()
+        capacity_dict = self.capacity_dict
         for g in self.model.Generators:
             unit_capacity = (
-                self.capacity_dict[g] *
+                capacity_dict[g] *
                 self.time_delta).to_value()
 
             for t in self.model.Time:
@@ -503,11 +505,13 @@ class DispatchModel():
         self.model.charge_rate_limit = pe.ConstraintList()
         self.model.storage_limit = pe.ConstraintList()
         self.model.set_storage = pe.ConstraintList()
+        capacity_dict = self.capacity_dict
+        efficiency_dict = self.efficiency_dict
         for s in self.model.StorageTech:
-            efficiency = self.efficiency_dict[s]
+            efficiency = efficiency_dict[s]
             storage_cap = self.model.storage_capacity[s]
             unit_capacity = (
-                self.capacity_dict[s] *
+                capacity_dict[s] *
                 self.time_delta).to_value()
             initial_storage = self.model.initial_storage[s]
             for t in self.model.Time:
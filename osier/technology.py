@@ -3,6 +3,8 @@ from unyt import MW, hr, kg, km, m, megatonnes
 from unyt import unyt_quantity, unyt_array
 from unyt.exceptions import UnitParseError
 from collections import OrderedDict
+from functools import lru_cache
+import copy
 
 import numpy as np
 import pandas as pd
@@ -21,11 +23,156 @@ _dim_opts = {'time': hr,
              'specific_energy': (MW * hr)**-1,
              'mass_per_energy': megatonnes * (MW * hr)**-1,
              'area_per_power': km**2 * MW**-1}
+_dim_exprs = {key: unit.dimensions for key, unit in _dim_opts.items()}
 
 _constant_types = (int, float, unyt_quantity)
 _array_types = (unyt.unyt_array, pd.core.series.Series, np.ndarray, list)
 
 
+@lru_cache(maxsize=512)
+def _parse_unit(value):
+    """
+    This function converts a unit string into a
+    :class:`unyt.unit_object.Unit`. Results are cached
+    since the same few unit strings are parsed every time
+    a :class:`Technology` sets its units.
+
+    Parameters
+    ----------
+    value : string
+        The unit symbol to parse, e.g. ``"MW*hr"``.
+
+    Returns
+    -------
+    unit : :class:`unyt.unit_object.Unit`
+        The parsed unit.
+    """
+    return unyt_quantity.from_string(value).units
+
+
+@lru_cache(maxsize=512)
+def _parse_quantity(value):
+    """
+    This function splits a quantity string into its magnitude
+    and :class:`unyt.unit_object.Unit`. Results are cached,
+    but callers should build a new quantity from the returned
+    pair since :class:`unyt.unyt_quantity` objects are mutable.
+
+    Parameters
+    ----------
+    value : string
+        The quantity to parse, e.g. ``"10 MW"``.
+
+    Returns
+    -------
+    magnitude : float
+        The numerical value of the quantity.
+    unit : :class:`unyt.unit_object.Unit`
+        The units of the quantity.
+    """
+    unyt_value = unyt_quantity.from_string(value)
+    return float(unyt_value.value), unyt_value.units
+
+
+@lru_cache(maxsize=256)
+def _derived_unit(kind, unit_power, unit_time, unit_mass, unit_length=None):
+    """
+    This function builds the unit of a derived quantity from
+    the base units of a :class:`Technology`. Results are cached
+    since :mod:`unyt` constructs a new unit expression for every
+    product or power of units.
+
+    Parameters
+    ----------
+    kind : string
+        The derived quantity. Accepts ``'energy'``,
+        ``'specific_power'``, ``'specific_energy'``,
+        ``'mass_per_energy'``, ``'ramp_rate'``, and
+        ``'area_per_power'``.
+    unit_power : :class:`unyt.unit_object.Unit`
+        The power units.
+    unit_time : :class:`unyt.unit_object.Unit`
+        The time units.
+    unit_mass : :class:`unyt.unit_object.Unit`
+        The mass units.
+    unit_length : :class:`unyt.unit_object.Unit`
+        The length units. Only required for ``'area_per_power'``.
+
+    Returns
+    -------
+    unit : :class:`unyt.unit_object.Unit`
+        The derived unit.
+    """
+    if kind == 'energy':
+        return unit_power * unit_time
+    elif kind == 'specific_power':
+        return unit_power**-1
+    elif kind == 'specific_energy':
+        return (unit_power * unit_time)**-1
+    elif kind == 'mass_per_energy':
+        return unit_mass * (unit_power * unit_time)**-1
+    elif kind == 'ramp_rate':
+        return unit_power * unit_time**-1
+    elif kind == 'area_per_power':
+        return unit_length**2 * unit_power**-1
+    else:
+        raise KeyError(f"Key <{kind}> not accepted.")
+
+
+@lru_cache(maxsize=1024)
+def _conversion_factor(from_unit, to_unit):
+    """
+    This function returns the multiplicative factor that converts
+    a value in `from_unit` to `to_unit`. Results are cached since
+    a :class:`Technology` converts between the same few pairs of
+    units every time a getter is called.
+
+    Parameters
+    ----------
+    from_unit : :class:`unyt.unit_object.Unit`
+        The original units.
+    to_unit : :class:`unyt.unit_object.Unit`
+        The target units.
+
+    Returns
+    -------
+    factor : float
+        The conversion factor.
+    """
+    return float((1.0 * from_unit).to_value(to_unit))
+
+
+def _to_units(quantity, unit):
+    """
+    This function converts a quantity to the given units. If the
+    quantity already has those units, the conversion is skipped
+    and a copy is returned instead, so callers never receive the
+    stored object. Otherwise the value is scaled by a cached
+    conversion factor, see :func:`_conversion_factor`.
+
+    Parameters
+    ----------
+    quantity : :class:`unyt.unyt_quantity` or :class:`unyt.unyt_array`
+        The quantity to convert.
+    unit : :class:`unyt.unit_object.Unit`
+        The target units.
+
+    Returns
+    -------
+    converted : :class:`unyt.unyt_quantity` or :class:`unyt.unyt_array`
+        A floating point copy of `quantity` in `unit`.
+    """
+    units = quantity.units
+    if (units == unit) and (units.expr == unit.expr):
+        if quantity.dtype.kind == 'f':
+            return copy.copy(quantity)
+        return quantity.astype(np.float64)
+    if units.base_offset or unit.base_offset:
+        return quantity.to(unit)
+    return quantity.__class__(quantity.d * _conversion_factor(units, unit),
+                              unit)
+
+
 def _validate_unit(value, dimension):
     """
     This function checks that a unit has the correct
@@ -52,12 +199,12 @@ def _validate_unit(value, dimension):
 
     valid_unit = None
     if isinstance(value, unyt.unit_object.Unit):
-        assert value.same_dimensions_as(exp_dim)
+        assert value.dimensions == _dim_exprs[dimension]
         valid_unit = value
     elif isinstance(value, str):
         try:
-            unit = unyt_quantity.from_string(value).units
-            assert unit.same_dimensions_as(exp_dim)
+            unit = _parse_unit(value.strip())
+            assert unit.dimensions == _dim_exprs[dimension]
             valid_unit = unit
         except UnitParseError:
             raise UnitParseError(f"Could not interpret <{value}>.")
@@ -90,7 +237,8 @@ def _validate_quantity(value, dimension):
     Returns
     -------
     valid_quantity : :class:`unyt.unyt_quantity`
-        The validated quantity.
+        The validated quantity. Quantities passed as ``unyt`` objects
+        are copied, so later changes to `value` do not affect it.
     """
     try:
         exp_dim = _dim_opts[dimension]
@@ -100,38 +248,34 @@ def _validate_quantity(value, dimension):
     valid_quantity = None
     if isinstance(value, unyt_quantity):
         try:
-            assert value.units.same_dimensions_as(exp_dim)
-            valid_quantity = value
+            assert value.units.dimensions == _dim_exprs[dimension]
+            valid_quantity = value.copy()
         except AssertionError:
             raise TypeError(
                 f"{value} has dimensions {value.units.dimensions}. "
-                f"Expected {exp_dim.dimensions}")
+                f"Expected {_dim_exprs[dimension]}")
     elif isinstance(value, unyt_array):
         try:
-            assert value.units.same_dimensions_as(exp_dim)
-            valid_quantity = value
+            assert value.units.dimensions == _dim_exprs[dimension]
+            valid_quantity = value.copy()
         except AssertionError:
             raise TypeError(
                 f"{value} has dimensions {value.units.dimensions}. "
-                f"Expected {exp_dim.dimensions}")
-    elif isinstance(value, np.ndarray):
-        valid_quantity = value * exp_dim
+                f"Expected {_dim_exprs[dimension]}")
     elif isinstance(value, pd.core.series.Series):
-        valid_quantity = value.values * exp_dim
-    elif isinstance(value, list):
-        valid_quantity = np.array(value) * exp_dim
-    elif isinstance(value, float):
-        valid_quantity = value * exp_dim
-    elif isinstance(value, int):
-        valid_quantity = value * exp_dim
+        valid_quantity = unyt_array(value.to_numpy(copy=True), exp_dim)
+    elif isinstance(value, (np.ndarray, list)):
+        valid_quantity = unyt_array(np.array(value), exp_dim)
+    elif isinstance(value, (float, int)) and not isinstance(value, bool):
+        valid_quantity = unyt_quantity(value, exp_dim)
     elif isinstance(value, str):
         try:
-            valid_quantity = float(value) * exp_dim
+            valid_quantity = unyt_quantity(float(value), exp_dim)
         except ValueError:
             try:
-                unyt_value = unyt_quantity.from_string(value)
-                assert unyt_value.units.same_dimensions_as(exp_dim)
-                valid_quantity = unyt_value
+                magnitude, unit = _parse_quantity(value.strip())
+                assert unit.dimensions == _dim_exprs[dimension]
+                valid_quantity = magnitude * unit
             except UnitParseError:
                 raise UnitParseError(f"Could not interpret <{value}>.")
             except AssertionError:
@@ -321,6 +465,50 @@ class Technology(object):
         else:
             return False
 
+    def __copy__(self):
+        """
+        Returns a shallow copy of the technology. Attribute values are
+        shared with the original, which is safe because the setters
+        store a copy of the value passed in and replace, rather than
+        modify, the stored quantities.
+        """
+        new_tech = self.__class__.__new__(self.__class__)
+        new_tech.__dict__.update(self.__dict__)
+        return new_tech
+
+    def with_units(self, unit_power, unit_time):
+        """
+        Returns a shallow copy of the technology with new power and
+        time units. The original technology is not modified.
+
+        Parameters
+        ----------
+        unit_power : str or :class:`unyt.unit_object.Unit`
+            The power units of the copy.
+        unit_time : str or :class:`unyt.unit_object.Unit`
+            The time units of the copy.
+
+        Returns
+        -------
+        new_tech : :class:`Technology`
+            The technology with updated units.
+        """
+        new_tech = copy.copy(self)
+        new_tech.unit_power = unit_power
+        new_tech.unit_time = unit_time
+        return new_tech
+
+    def _unit_of(self, kind):
+        """
+        Returns the unit of a derived quantity, e.g. ``'specific_energy'``,
+        in this technology's units. See :func:`_derived_unit`.
+        """
+        return _derived_unit(kind,
+                             self._unit_power,
+                             self._unit_time,
+                             self._unit_mass,
+                             self._unit_length)
+
     @property
     def unit_power(self):
         return self._unit_power
@@ -371,7 +559,7 @@ class Technology(object):
 
     @property
     def unit_energy(self):
-        return self._unit_power * self._unit_time
+        return self._unit_of('energy')
 
     @unit_energy.setter
     def unit_energy(self, value):
@@ -379,16 +567,19 @@ class Technology(object):
 
     @property
     def capacity(self):
-        return self._capacity.to(self._unit_power)
+        return _to_units(self._capacity, self._unit_power)
 
     @capacity.setter
     def capacity(self, value):
         valid_quantity = _validate_quantity(value, dimension="power")
-        self._capacity = valid_quantity.to(self._unit_power)
+        if valid_quantity.units != self._unit_power:
+            valid_quantity = valid_quantity.to(self._unit_power)
+        self._capacity = valid_quantity
 
     @property
     def capital_cost(self):
-        return self._capital_cost.to(self._unit_power**-1)
+        return _to_units(self._capital_cost,
+                         self._unit_of('specific_power'))
 
     @capital_cost.setter
     def capital_cost(self, value):
@@ -397,7 +588,8 @@ class Technology(object):
 
     @property
     def om_cost_fixed(self):
-        return self._om_cost_fixed.to(self._unit_power**-1)
+        return _to_units(self._om_cost_fixed,
+                         self._unit_of('specific_power'))
 
     @om_cost_fixed.setter
     def om_cost_fixed(self, value):
@@ -406,14 +598,14 @@ class Technology(object):
 
     @property
     def om_cost_variable(self):
+        unit = self._unit_of('specific_energy')
         if isinstance(self._om_cost_variable, _constant_types):
-            return self._om_cost_variable.to(self.unit_energy**-1)
+            return _to_units(self._om_cost_variable, unit)
         elif isinstance(self._om_cost_variable, _array_types):
             if isinstance(self._om_cost_variable, unyt.unyt_array):
-                return self._om_cost_variable.to(self.unit_energy**-1)
+                return _to_units(self._om_cost_variable, unit)
             else:
-                return np.array(self._om_cost_variable) * \
-                    (self.unit_energy**-1)
+                return np.array(self._om_cost_variable) * unit
 
     @om_cost_variable.setter
     def om_cost_variable(self, value):
@@ -422,13 +614,14 @@ class Technology(object):
 
     @property
     def fuel_cost(self):
+        unit = self._unit_of('specific_energy')
         if isinstance(self._fuel_cost, _constant_types):
-            return self._fuel_cost.to(self.unit_energy**-1)
+            return _to_units(self._fuel_cost, unit)
         elif isinstance(self._fuel_cost, _array_types):
             if isinstance(self._fuel_cost, unyt.unyt_array):
-                return self._fuel_cost.to(self.unit_energy**-1)
+                return _to_units(self._fuel_cost, unit)
             else:
-                return np.array(self._fuel_cost) * (self.unit_energy**-1)
+                return np.array(self._fuel_cost) * unit
 
     @fuel_cost.setter
     def fuel_cost(self, value):
@@ -437,7 +630,8 @@ class Technology(object):
 
     @property
     def co2_rate(self):
-        return self._co2_rate.to(self.unit_mass * self.unit_energy**-1)
+        return _to_units(self._co2_rate,
+                         self._unit_of('mass_per_energy'))
 
     @co2_rate.setter
     def co2_rate(self, value):
@@ -445,7 +639,8 @@ class Technology(object):
 
     @property
     def lifecycle_co2_rate(self):
-        return self._lifecycle_co2_rate.to(self.unit_mass * self.unit_energy**-1)
+        return _to_units(self._lifecycle_co2_rate,
+                         self._unit_of('mass_per_energy'))
 
     @lifecycle_co2_rate.setter
     def lifecycle_co2_rate(self, value):
@@ -453,7 +648,8 @@ class Technology(object):
 
     @property
     def land_intensity(self):
-        return self._land_intensity.to(self.unit_area * self.unit_power**-1)
+        return _to_units(self._land_intensity,
+                         self._unit_of('area_per_power'))
 
     @land_intensity.setter
     def land_intensity(self, value):
@@ -480,25 +676,24 @@ class Technology(object):
         different sizes and types. Therefore it is recommended that users
         pass values of the same size and type to prevent unexpected behavior.
         """
-        if (isinstance(self.fuel_cost, _constant_types)
-                and isinstance(self.om_cost_variable, _constant_types)):
-            return self.fuel_cost + self.om_cost_variable
-        elif (isinstance(self.fuel_cost, _array_types) and isinstance(self.om_cost_variable, _constant_types)):
-            return self.fuel_cost + \
-                np.ones(len(self.fuel_cost)) * self.om_cost_variable
-        elif (isinstance(self.fuel_cost, _constant_types) and isinstance(self.om_cost_variable, _array_types)):
-            return self.fuel_cost * \
-                np.ones(len(self.om_cost_variable)) + self.om_cost_variable
-        elif (isinstance(self.fuel_cost, _constant_types) and isinstance(self.om_cost_variable, _array_types)):
-            return self.fuel_cost * \
-                np.ones(len(self.om_cost_variable)) + self.om_cost_variable
-        elif (isinstance(self.fuel_cost, _array_types) and isinstance(self.om_cost_variable, _array_types)):
-            min_len = min(len(self.fuel_cost), len(self.om_cost_variable))
-            return self.fuel_cost[:min_len] + self.om_cost_variable[:min_len]
+        fuel_cost = self.fuel_cost
+        om_cost_variable = self.om_cost_variable
+        if (isinstance(fuel_cost, _constant_types)
+                and isinstance(om_cost_variable, _constant_types)):
+            return fuel_cost + om_cost_variable
+        elif (isinstance(fuel_cost, _array_types) and isinstance(om_cost_variable, _constant_types)):
+            return fuel_cost + \
+                np.ones(len(fuel_cost)) * om_cost_variable
+        elif (isinstance(fuel_cost, _constant_types) and isinstance(om_cost_variable, _array_types)):
+            return fuel_cost * \
+                np.ones(len(om_cost_variable)) + om_cost_variable
+        elif (isinstance(fuel_cost, _array_types) and isinstance(om_cost_variable, _array_types)):
+            min_len = min(len(fuel_cost), len(om_cost_variable))
+            return fuel_cost[:min_len] + om_cost_variable[:min_len]
         else:
             raise TypeError(
-                f"Fuel cost has type <{type(self.fuel_cost)}>.\n" +
-                f"OM variable cost has type <{type(self.om_cost_variable)}>.\n"
+                f"Fuel cost has type <{type(fuel_cost)}>.\n" +
+                f"OM variable cost has type <{type(om_cost_variable)}>.\n"
                 "One or both of these types are unknown.")
 
     def variable_cost_ts(self, size):
@@ -523,62 +718,82 @@ class Technology(object):
         var_cost_ts : :class:`numpy.ndarray`
             The variable cost time series.
         """
-        if isinstance(self.variable_cost, _constant_types):
-            var_cost_ts = np.ones(size) * self.variable_cost
+        variable_cost = self.variable_cost
+        if isinstance(variable_cost, _constant_types):
+            var_cost_ts = np.ones(size) * variable_cost
             return var_cost_ts
 
-        elif isinstance(self.variable_cost, _array_types):
+        elif isinstance(variable_cost, _array_types):
             try:
-                var_cost_ts = self.variable_cost[:size]
+                var_cost_ts = variable_cost[:size]
                 assert len(var_cost_ts) == size
             except AssertionError as e:
                 raise AssertionError(
                     f"Variable cost data too short ({len(var_cost_ts)} < {size})")
             return var_cost_ts
         
-    def to_dataframe(self, cast_to_string=True):
+    def to_record(self, cast_to_string=True):
         """
-        Writes all technology attributes to a :class:`pandas.DataFrame` for export
-        and manipulation.
+        Writes all technology attributes to a dictionary with one
+        value per column. Used by :meth:`to_dataframe` and
+        :func:`osier.technology_dataframe`.
+
+        Parameters
+        ----------
+        cast_to_string : bool
+            If True, numerical values are formatted as strings with
+            three significant figures. Default is True.
+
+        Returns
+        -------
+        tech_data : :class:`collections.OrderedDict`
+            A dictionary of {column : value} pairs.
         """
 
         tech_data = OrderedDict()
-        tech_data['technology_name'] = [self.technology_name]
-        tech_data['technology_category'] = [self.technology_category]
-        tech_data['technology_type'] = [self.technology_type]
-        tech_data['dispatchable'] = [str(self.dispatchable)]
-        tech_data['renewable'] = [str(self.renewable)]
-        tech_data['fuel_type'] = [str(self.fuel_type)]
+        tech_data['technology_name'] = self.technology_name
+        tech_data['technology_category'] = self.technology_category
+        tech_data['technology_type'] = self.technology_type
+        tech_data['dispatchable'] = str(self.dispatchable)
+        tech_data['renewable'] = str(self.renewable)
+        tech_data['fuel_type'] = str(self.fuel_type)
 
         for key, value in self.__dict__.items():
             if key in tech_data:
                 continue
             elif value is None:
                 col = key.strip('_')
-                tech_data[col] = [str(value)] 
+                tech_data[col] = str(value)
             else:
                 if isinstance(value, unyt.unit_object.Unit):
                     continue
                 elif isinstance(value, unyt_quantity):
                     col = f"{key.strip('_')} ({value.units})"
                     if cast_to_string:
-                        tech_data[col] = ["{:.3g}".format(value.to_value())]
+                        tech_data[col] = "{:.3g}".format(value.to_value())
                     else:
-                        tech_data[col] = [np.round(value.to_value(),10)]
+                        tech_data[col] = np.round(value.to_value(),10)
                 elif isinstance(value, (int, float)):
                     col = key.strip('_')
                     if cast_to_string:
-                        tech_data[col] = ["{:.3g}".format(value)]
+                        tech_data[col] = "{:.3g}".format(value)
                     else:
-                        tech_data[col] = [np.round(value,10)]
+                        tech_data[col] = np.round(value,10)
                 else:
                     continue
 
-        tech_dataframe = pd.DataFrame(tech_data).set_index('technology_name')
+        return tech_data
+
+    def to_dataframe(self, cast_to_string=True):
+        """
+        Writes all technology attributes to a :class:`pandas.DataFrame` for export
+        and manipulation.
+        """
+
+        tech_data = self.to_record(cast_to_string=cast_to_string)
+        tech_dataframe = pd.DataFrame([tech_data]).set_index('technology_name')
 
         return tech_dataframe
-                
-            
 
 
 class RampingTechnology(Technology):
@@ -631,19 +846,13 @@ class RampingTechnology(Technology):
     def ramp_up(self):
         return (
             self.capacity *
-            self.ramp_up_rate).to(
-            self.unit_power *
-            self.unit_time**-1
-        )
+            self.ramp_up_rate).to(self._unit_of('ramp_rate'))
 
     @property
     def ramp_down(self):
         return (
             self.capacity *
-            self.ramp_down_rate).to(
-            self.unit_power *
-            self.unit_time**-1
-        )
+            self.ramp_down_rate).to(self._unit_of('ramp_rate'))
 
 
 class ThermalTechnology(RampingTechnology):
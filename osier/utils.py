@@ -1,16 +1,16 @@
-from osier import Technology
-from osier.technology import _validate_unit
+from osier.technology import Technology, _validate_unit
 from unyt import unit_object
 import copy
 from typing import Iterable
+from operator import attrgetter
+from itertools import compress, filterfalse
 import pandas as pd
 
-from osier.technology import Technology
-
 
 def synchronize_units(tech_list: Iterable[Technology],
                       unit_power: unit_object,
-                      unit_time: unit_object) -> Iterable[Technology]:
+                      unit_time: unit_object,
+                      deep: bool = False) -> Iterable[Technology]:
     """
     This function ensures that all objects in the technology list
     have units consistent with the model's units. An
@@ -27,14 +27,22 @@ def synchronize_units(tech_list: Iterable[Technology],
     is in minutes and power is in ``kW``.
 
     .. note::
-        The objects in the original list are copied by default. This
-        may result in slower run time.
+        The objects in the original list are shallow copied, so the
+        original technologies keep their units. Pass ``deep=True``
+        to return fully independent copies.
 
     Parameters
     ----------
     tech_list : list of :class:`osier.Technology` objects
         The list of technology objects whose units need to be
         synchronized.
+    unit_power : str or :class:`unyt.unit_object.Unit`
+        The power units for every technology in the list.
+    unit_time : str or :class:`unyt.unit_object.Unit`
+        The time units for every technology in the list.
+    deep : bool
+        If True, each technology is deep copied before its units are
+        set. Default is False.
 
     Returns
     -------
@@ -42,11 +50,21 @@ def synchronize_units(tech_list: Iterable[Technology],
         The list of technology objects that have synchronized units.
     """
 
-    synced_list = [copy.deepcopy(t) for t in tech_list]
+    unit_power = _validate_unit(unit_power, dimension="power")
+    unit_time = _validate_unit(unit_time, dimension="time")
+
+    tech_list = list(tech_list)
 
-    for t in synced_list:
-        t.unit_power = _validate_unit(unit_power, dimension="power")
-        t.unit_time = _validate_unit(unit_time, dimension="time")
+    if deep:
+        synced_list = []
+        for t in tech_list:
+            new_tech = copy.deepcopy(t)
+            new_tech.unit_power = unit_power
+            new_tech.unit_time = unit_time
+            synced_list.append(new_tech)
+        return synced_list
+
+    synced_list = [t.with_units(unit_power, unit_time) for t in tech_list]
 
     return synced_list
 
@@ -67,7 +85,7 @@ def get_tech_names(technology_list):
         The list of technology names.
     """
 
-    tech_names = [t.technology_name for t in technology_list]
+    tech_names = list(map(attrgetter('technology_name'), technology_list))
 
     return tech_names
 
@@ -88,7 +106,9 @@ def get_dispatchable_techs(technology_list):
         The list of dispatchable technologies.
     """
 
-    dispatchable_techs = [t for t in technology_list if t.dispatchable]
+    technology_list = list(technology_list)
+    flags = list(map(attrgetter('dispatchable'), technology_list))
+    dispatchable_techs = list(compress(technology_list, flags))
 
     return dispatchable_techs
 
@@ -109,7 +129,8 @@ def get_nondispatchable_techs(technology_list):
         The list of non dispatchable technologies.
     """
 
-    non_dispatchable_techs = [t for t in technology_list if not t.dispatchable]
+    non_dispatchable_techs = list(filterfalse(attrgetter('dispatchable'),
+                                              technology_list))
 
     return non_dispatchable_techs
 
@@ -130,12 +151,59 @@ def get_dispatchable_names(technology_list):
         The list of dispatchable technology names.
     """
 
-    dispatchable_names = [
-        t.technology_name for t in technology_list if t.dispatchable]
+    technology_list = list(technology_list)
+    flags = list(map(attrgetter('dispatchable'), technology_list))
+    dispatchable_names = list(compress(
+        map(attrgetter('technology_name'), technology_list), flags))
 
     return dispatchable_names
 
 
+def partition_techs(technology_list):
+    """
+    Splits a list of :class:`osier.Technology` objects by
+    :attr:`dispatchable` in a single pass. Equivalent to calling
+    :func:`get_tech_names`, :func:`get_dispatchable_techs`,
+    :func:`get_nondispatchable_techs`, and
+    :func:`get_dispatchable_names` on the same list.
+
+    Parameters
+    ----------
+    technology_list : list of :class:`osier.Technology` objects
+        The list of technologies.
+
+    Returns
+    -------
+    tech_names : list of str
+        The list of technology names.
+    dispatchable_techs : list of :class:`osier.Technology`
+        The list of dispatchable technologies.
+    non_dispatchable_techs : list of :class:`osier.Technology`
+        The list of non dispatchable technologies.
+    dispatchable_names : list of str
+        The list of dispatchable technology names.
+    """
+
+    tech_names = []
+    dispatchable_techs = []
+    non_dispatchable_techs = []
+    dispatchable_names = []
+
+    for t in technology_list:
+        name = t.technology_name
+        tech_names.append(name)
+        if t.dispatchable:
+            dispatchable_techs.append(t)
+            dispatchable_names.append(name)
+        else:
+            non_dispatchable_techs.append(t)
+
+    return (tech_names,
+            dispatchable_techs,
+            non_dispatchable_techs,
+            dispatchable_names)
+
+
 def technology_dataframe(technology_list, cast_to_string=True):
     """
     Returns a :class:`pandas.DataFrame` with a complete set
@@ -145,6 +213,9 @@ def technology_dataframe(technology_list, cast_to_string=True):
     ----------
     technology_list : list of :class:`osier.Technology` objects
         The list of technologies.
+    cast_to_string : bool
+        If True, numerical values are formatted as strings. See
+        :meth:`osier.Technology.to_record`. Default is True.
 
     Returns
     -------
@@ -152,12 +223,14 @@ def technology_dataframe(technology_list, cast_to_string=True):
         A dataframe of all technology data.
     """
 
-    frames = []
+    records = [t.to_record(cast_to_string=cast_to_string)
+               for t in technology_list]
 
-    for t in technology_list:
-        frames.append(t.to_dataframe(cast_to_string=cast_to_string))
+    if len(records) == 0:
+        return pd.DataFrame()
 
-    technology_dataframe = pd.concat(frames, axis=0)
+    technology_dataframe = pd.DataFrame.from_records(
+        records).set_index('technology_name')
 
     return technology_dataframe
     
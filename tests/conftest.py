@@ -0,0 +1,31 @@
+import os
+import pytest
+import pyomo.environ as pe
+
+
+def pytest_addoption(parser):
+    parser.addoption("--skip-solver",
+                     action="store_true",
+                     default=False,
+                     help="Skip tests that need a solver if it is not installed.")
+
+
+@pytest.fixture(scope="session")
+def solver(request):
+    """
+    This fixture returns the name of the solver used by the test suite.
+    The default is ``cbc`` and may be overridden with the
+    ``OSIER_SOLVER`` environment variable (e.g. ``OSIER_SOLVER=glpk``).
+    A missing solver fails the tests that request it, unless
+    ``OSIER_SOLVER`` is set or ``--skip-solver`` is passed, in which
+    case they are skipped.
+    """
+    name = os.environ.get("OSIER_SOLVER", "cbc")
+    if not pe.SolverFactory(name).available(exception_flag=False):
+        message = f"Solver <{name}> is not installed."
+        if (("OSIER_SOLVER" in os.environ)
+                or request.config.getoption("--skip-solver")):
+            pytest.skip(message)
+        pytest.fail(message)
+
+    return name
@@ -12,14 +12,15 @@ N_DAYS = 2
 N = N_HOURS * N_DAYS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def net_demand():
 
     phase_shift = 0
     base_load = 1.5
     hours = np.linspace(0, N, N)
-    demand = (np.sin((hours * np.pi / N_HOURS * 2 + phase_shift))
-              * -1 + np.ones(N) * (base_load + 1))
+    demand = (base_load + 1) - np.sin(hours * np.pi / N_HOURS * 2
+                                      + phase_shift)
+    demand.flags.writeable = False
 
     return demand
 
@@ -37,6 +38,7 @@ def test_deap_init(net_demand):
     model = osier.OsierDEAP(problem=problem,
                             pop_size=100)
     
+    assert problem.dispatchable_techs == [t for t in techs if t.dispatchable]
     assert model.algorithm == 'nsga2'
     assert model.n_obj == 2
     assert model.completed_generations == 0
@@ -3,16 +3,8 @@ from osier.equations import (annualized_capital_cost, annualized_fixed_cost, tot
 from osier import Technology, DispatchModel
 import numpy as np
 import pytest
-import sys
 import functools
 
-if "win32" in sys.platform:
-    solver = 'cbc'
-elif "linux" in sys.platform:
-    solver = "cbc"
-else:
-    solver = "cbc"
-
 TOL = 1e-5
 N_HOURS = 24
 N_DAYS = 2
@@ -47,46 +39,24 @@ def technology_set_1():
 
     return [nuclear, natural_gas]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def net_demand():
 
     phase_shift = 0
     base_load = 1.5
     hours = np.linspace(0, N, N)
-    demand = (np.sin((hours * np.pi / N_HOURS * 2 + phase_shift))
-              * -1 + np.ones(N) * (base_load + 1))
+    demand = (base_load + 1) - np.sin(hours * np.pi / N_HOURS * 2
+                                      + phase_shift)
+    demand.flags.writeable = False
 
     return demand
 
 
-def test_annualized_capital_cost(technology_set_1):
-    """
-    Tests the annualized capital cost is calculated correctly.
-    """
-    nuclear, natural_gas = technology_set_1
-
-    expected = (nuclear.total_capital_cost / nuclear.lifetime) \
-               + (natural_gas.total_capital_cost / natural_gas.lifetime)
-    actual = annualized_capital_cost(technology_list=technology_set_1)
-
-    assert expected == pytest.approx(actual)
-
-
-def test_annualized_fixed_cost(technology_set_1):
+@pytest.fixture(scope="module")
+def solved_model(technology_set_1, net_demand, solver):
     """
-    Tests the annualized fixed cost is calculated correctly.
-    """
-    nuclear, natural_gas = technology_set_1
-
-    expected = (nuclear.annual_fixed_cost) + (natural_gas.annual_fixed_cost)
-    actual = annualized_fixed_cost(technology_list=technology_set_1)
-
-    assert expected == pytest.approx(actual)
-
-
-def test_total_cost(technology_set_1, net_demand):
-    """
-    Tests that :func:`total_cost` produces expected results.
+    This fixture solves a single :class:`DispatchModel` shared by
+    the objective function tests.
     """
     model = DispatchModel(technology_set_1,
                           net_demand=net_demand,
@@ -95,66 +65,60 @@ def test_total_cost(technology_set_1, net_demand):
                           allow_blackout=False)
     model.solve()
 
-    expected = annualized_fixed_cost(technology_set_1) \
-                + annualized_capital_cost(technology_set_1) \
-                + model.objective
-    actual = total_cost(technology_set_1, model)
-
-    assert expected == pytest.approx(actual)
+    return model
 
 
-def test_annual_co2(technology_set_1, net_demand):
+def test_annualized_capital_cost(technology_set_1):
     """
-    Tests that :func:`annual_co2` produces expected results.
+    Tests the annualized capital cost is calculated correctly.
     """
     nuclear, natural_gas = technology_set_1
-    model = DispatchModel(technology_set_1,
-                          net_demand=net_demand,
-                          solver=solver,
-                          curtailment=False,
-                          allow_blackout=False)
-    model.solve()
 
-    expected = (model.results["Nuclear"].sum() * nuclear.co2_rate) \
-                + (model.results["NaturalGas"].sum() * natural_gas.co2_rate)
-    actual = annual_emission(technology_set_1, model, emission='co2_rate')
+    expected = (nuclear.total_capital_cost / nuclear.lifetime) \
+               + (natural_gas.total_capital_cost / natural_gas.lifetime)
+    actual = annualized_capital_cost(technology_list=technology_set_1)
 
     assert expected == pytest.approx(actual)
 
 
-def test_objective_from_capacity(technology_set_1, net_demand):
+def test_annualized_fixed_cost(technology_set_1):
     """
-    Tests that :func:`objective_from_capacity` produces expected results.
+    Tests the annualized fixed cost is calculated correctly.
     """
-    model = DispatchModel(technology_set_1,
-                          net_demand=net_demand,
-                          solver=solver,
-                          curtailment=False,
-                          allow_blackout=False)
-    model.solve()
+    nuclear, natural_gas = technology_set_1
 
-    func = functools.partial(objective_from_capacity, attribute='om_cost_fixed')
-    expected = annualized_fixed_cost(technology_set_1, model)
-    actual = func(technology_list=technology_set_1, 
-                  solved_dispatch_model=model)
+    expected = (nuclear.annual_fixed_cost) + (natural_gas.annual_fixed_cost)
+    actual = annualized_fixed_cost(technology_list=technology_set_1)
 
     assert expected == pytest.approx(actual)
 
 
-def test_objective_from_energy(technology_set_1, net_demand):
+@pytest.mark.parametrize(
+    "func, expected_func",
+    [(total_cost,
+      lambda techs, model: annualized_fixed_cost(techs)
+      + annualized_capital_cost(techs)
+      + model.objective),
+     (functools.partial(annual_emission, emission='co2_rate'),
+      lambda techs, model: sum(model.results[t.technology_name].sum()
+                               * t.co2_rate for t in techs)),
+     (functools.partial(objective_from_capacity, attribute='om_cost_fixed'),
+      lambda techs, model: annualized_fixed_cost(techs, model)),
+     (functools.partial(objective_from_energy, attribute='co2_rate'),
+      lambda techs, model: annual_emission(techs, model,
+                                           emission='co2_rate'))],
+    ids=["total_cost",
+         "annual_co2",
+         "objective_from_capacity",
+         "objective_from_energy"])
+def test_dispatch_objectives(technology_set_1, solved_model,
+                             func, expected_func):
     """
-    Tests that :func:`objective_from_energy` produces expected results.
+    Tests that the objective functions evaluated on a solved
+    :class:`DispatchModel` produce expected results.
     """
-    model = DispatchModel(technology_set_1,
-                          net_demand=net_demand,
-                          solver=solver,
-                          curtailment=False,
-                          allow_blackout=False)
-    model.solve()
-
-    func = functools.partial(objective_from_energy, attribute='co2_rate')
-    expected = annual_emission(technology_set_1, model, emission='co2_rate')
-    actual = func(technology_list=technology_set_1, 
-                  solved_dispatch_model=model)
+    expected = expected_func(technology_set_1, solved_model)
+    actual = func(technology_list=technology_set_1,
+                  solved_dispatch_model=solved_model)
 
-    assert expected == pytest.approx(actual)
\ No newline at end of file
+    assert expected == pytest.approx(actual)
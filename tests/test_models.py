@@ -1,18 +1,12 @@
 from osier import DispatchModel
+from osier.models import dispatch
 from osier import Technology, ThermalTechnology, StorageTechnology, RampingTechnology
 from unyt import unyt_array
 import unyt
 import numpy as np
 import pandas as pd
 import pytest
-import sys
-
-if "win32" in sys.platform:
-    solver = 'cbc'
-elif "linux" in sys.platform:
-    solver = "cbc"
-else:
-    solver = "cbc"
+import copy
 
 TOL = 1e-5
 N_HOURS = 24
@@ -46,7 +40,7 @@ def technology_set_1():
     return [nuclear, natural_gas]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def technology_set_2():
     """
     This fixture creates technologies from
@@ -74,7 +68,7 @@ def technology_set_2():
     return [nuclear, natural_gas]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def technology_set_3():
     """
     This fixture creates technologies from
@@ -102,7 +96,7 @@ def technology_set_3():
     return [nuclear, natural_gas]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def technology_set_4():
     """
     This fixture uses creates technologies from
@@ -132,14 +126,15 @@ def technology_set_4():
     return [nuclear, battery]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def net_demand():
 
     phase_shift = 0
     base_load = 1.5
     hours = np.linspace(0, N, N)
-    demand = (np.sin((hours * np.pi / N_HOURS * 2 + phase_shift))
-              * -1 + np.ones(N) * (base_load + 1))
+    demand = (base_load + 1) - np.sin(hours * np.pi / N_HOURS * 2
+                                      + phase_shift)
+    demand.flags.writeable = False
 
     return demand
 
@@ -150,36 +145,53 @@ def test_dispatch_model_initialize(technology_set_1, net_demand):
     """
     model = DispatchModel(technology_set_1,
                           net_demand=net_demand,
-                          solver=solver,
                           curtailment=False,
                           allow_blackout=False)
     assert model.technology_list == technology_set_1
     assert model.tech_set == [t.technology_name for t in technology_set_1]
-    assert model.solver == solver
+    assert model.solver == 'cbc'
     assert len(model.capacity_dict) == len(technology_set_1)
     assert len(model.indices) == len(net_demand) * len(technology_set_1)
     assert model.time_delta == 1 * unyt.hour
 
 
+def test_dispatch_model_copies_techs(technology_set_1, net_demand):
+    """
+    Tests that changing a model's technologies does not change the
+    caller's technologies or the built-in curtailment and load loss
+    technologies.
+    """
+    capacities = [t.capacity for t in technology_set_1]
+    model = DispatchModel(technology_set_1,
+                          net_demand=net_demand)
+    for t in model.technology_list:
+        t.capacity = 1
+
+    assert [t.capacity for t in technology_set_1] == capacities
+    assert dispatch.curtailment_tech.capacity == dispatch.MEDIUM_NUMBER
+    assert dispatch.reliability_tech.capacity == dispatch.MEDIUM_NUMBER
+
+    new_model = DispatchModel(technology_set_1,
+                              net_demand=net_demand)
+    assert new_model.capacity_dict['Curtailment'] == dispatch.MEDIUM_NUMBER
+
+
 @pytest.mark.filterwarnings("ignore")
 def test_dispatch_model_time_delta(technology_set_1, net_demand):
     """
     Tests that the model properly initializes the time delta attribute.
     """
-    t1 = pd.date_range('1/1/2022', '6/1/2022', freq='2D')[:N]
-    t2 = pd.date_range('1/1/2022', '3/1/2070', freq='Y')[:N]
+    t1 = pd.date_range('1/1/2022', periods=N, freq='2D')
+    t2 = pd.date_range('1/1/2022', periods=N, freq='YE')
     df1 = pd.DataFrame({'data': net_demand}, index=t1)
     df2 = pd.DataFrame({'data': net_demand}, index=t2)
 
     model1 = DispatchModel(technology_set_1,
-                           net_demand=df1,
-                           solver=solver)
+                           net_demand=df1)
     model2 = DispatchModel(technology_set_1,
-                           net_demand=df2,
-                           solver=solver)
+                           net_demand=df2)
     model3 = DispatchModel(technology_set_1,
-                           net_demand=net_demand,
-                           solver=solver)
+                           net_demand=net_demand)
 
     assert model1.time_delta == 2 * unyt.day
     assert model2.time_delta == 1 * unyt.hour
@@ -188,7 +200,7 @@ def test_dispatch_model_time_delta(technology_set_1, net_demand):
     assert model3.time_delta == 2 * unyt.hour
 
 
-def test_dispatch_model_solve_case1(technology_set_1, net_demand):
+def test_dispatch_model_solve_case1(technology_set_1, net_demand, solver):
     """
     Tests that the dispatch model produces expected results. Where all
     the technologies are simply :class:`Technology` objects. The model
@@ -211,7 +223,7 @@ def test_dispatch_model_solve_case1(technology_set_1, net_demand):
     assert model.results['NaturalGas'].sum() == pytest.approx(0.0, rel=TOL)
 
 
-def test_dispatch_model_solve_case2(technology_set_2, net_demand):
+def test_dispatch_model_solve_case2(technology_set_2, net_demand, solver):
     """
     Tests that the dispatch model produces expected results. The technologies
     are :class:`ThermalTechnology` objects. In this case, the `Nuclear`
@@ -232,7 +244,7 @@ def test_dispatch_model_solve_case2(technology_set_2, net_demand):
     assert model.objective == pytest.approx(expected_result, rel=TOL)
 
 
-def test_dispatch_model_solve_case3(technology_set_3, net_demand):
+def test_dispatch_model_solve_case3(technology_set_3, net_demand, solver):
     """
     Tests that a dispatch model with ramping constraints behaves
     as expected.
@@ -253,7 +265,7 @@ def test_dispatch_model_solve_case3(technology_set_3, net_demand):
         -nuclear.ramp_down_rate.to_value(), abs=TOL)
 
 
-def test_dispatch_model_solve_case4(technology_set_4, net_demand):
+def test_dispatch_model_solve_case4(technology_set_4, net_demand, solver):
     """
     Tests that storage constraints behave as expected.
     """
@@ -271,7 +283,7 @@ def test_dispatch_model_solve_case4(technology_set_4, net_demand):
     assert (total_gen - net_demand.sum()) == pytest.approx(0, abs=TOL)
     assert binary_charging == pytest.approx(0, abs=TOL)
 
-def test_dispatch_model_solve_case5(technology_set_4, net_demand):
+def test_dispatch_model_solve_case5(technology_set_4, net_demand, solver):
     """
     Tests that the curtailment technology behaves as expected.
     """
@@ -286,12 +298,12 @@ def test_dispatch_model_solve_case5(technology_set_4, net_demand):
     assert (total_gen - net_demand.sum()) == pytest.approx(0, abs=TOL)
 
 
-def test_dispatch_model_solve_case6(technology_set_4, net_demand):
+def test_dispatch_model_solve_case6(technology_set_4, net_demand, solver):
     """
     Tests that the reliability technology behaves as expected.
     """
 
-    nuclear, battery = technology_set_4
+    nuclear = copy.copy(technology_set_4[0])
     nuclear.capacity = 2
     model = DispatchModel([nuclear],
                           net_demand=net_demand,
@@ -44,3 +44,54 @@ def test_synchronize_units(technology_set_1):
     assert [t.unit_power for t in synced] == [u_p, u_p]
     assert [t.unit_time for t in synced] == [u_t, u_t]
     assert [t.unit_energy for t in synced] == [u_e, u_e]
+    assert [t.unit_power for t in technology_set_1] == [MW, MW]
+
+    generated = synchronize_units((t for t in technology_set_1),
+                                  unit_power=u_p, unit_time=u_t)
+    assert generated == technology_set_1
+
+    deep = synchronize_units(technology_set_1, unit_power=MW, unit_time=hour,
+                             deep=True)
+    assert deep == technology_set_1
+    assert not any(a is b for a, b in zip(deep, technology_set_1))
+
+
+def test_dispatchable_helpers_accept_iterators(technology_set_1):
+    """
+    Tests that the dispatchable helpers read their input only once.
+    """
+    nuclear, natural_gas = technology_set_1
+    natural_gas.dispatchable = False
+
+    assert get_dispatchable_techs(t for t in technology_set_1) == [nuclear]
+    assert get_dispatchable_names(t for t in technology_set_1) == ['Nuclear']
+
+
+def test_partition_techs(technology_set_1):
+    """
+    Tests that :func:`partition_techs` matches the individual
+    helper functions.
+    """
+    nuclear, natural_gas = technology_set_1
+    natural_gas.dispatchable = False
+
+    names, dispatchable, non_dispatchable, dispatchable_names = \
+        partition_techs(technology_set_1)
+    assert names == get_tech_names(technology_set_1)
+    assert dispatchable == get_dispatchable_techs(technology_set_1)
+    assert non_dispatchable == get_nondispatchable_techs(technology_set_1)
+    assert dispatchable_names == get_dispatchable_names(technology_set_1)
+    assert dispatchable_names == ['Nuclear']
+
+
+def test_technology_dataframe(technology_set_1):
+    """
+    Tests that :func:`technology_dataframe` has one row per technology.
+    """
+    df = technology_dataframe(technology_set_1)
+    assert list(df.index) == ['Nuclear', 'NaturalGas']
+
+    single = technology_dataframe(technology_set_1[:1])
+    assert single.equals(df.loc[['Nuclear']])
+
+    assert technology_dataframe([]).empty